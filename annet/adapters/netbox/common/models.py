@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional, Any, Dict
 
 from annet.annlib.netdev.views.dump import DumpableView
@@ -17,19 +18,19 @@ class Entity(DumpableView):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     value: str
     label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class IpFamily:
     value: int
     label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceType:
     id: int
     manufacturer: Entity
@@ -93,13 +94,13 @@ class InterfaceConnectedEndpoint(Entity):
     device: Entity
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceType:
     value: str
     label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceMode:
     value: str
     label: str
@@ -167,4 +168,9 @@ class NetboxDevice(Entity):
         return type(self) is type(other) and self.url == other.url
 
     def is_pc(self):
+        return self._is_pc
+
+    @cached_property
+    def _is_pc(self) -> bool:
+        # device type never changes for a loaded device
         return self.device_type.manufacturer.name == "Mellanox"
@@ -1,3 +1,4 @@
+import sys
 from logging import getLogger
 from typing import Optional, List, Union
 
@@ -48,6 +49,7 @@ def extend_device(
     platform_name = ""
     if device.platform:
         platform_name = device.platform.name
+    name = sys.intern(device.name)
 
     return models.NetboxDevice(
         url=device.url,
@@ -73,8 +75,8 @@ def extend_device(
         created=device.created,
         last_updated=device.last_updated,
 
-        fqdn=device.name,
-        hostname=device.name,
+        fqdn=name,
+        hostname=name,
         hw=get_hw(manufacturer, model, platform_name),
         breed=get_breed(manufacturer, model),
         interfaces=[],
@@ -159,10 +161,12 @@ class NetboxStorageV24(Storage):
     def _load_devices(self, query: NetboxQuery) -> List[api_models.Device]:
         if not query.globs:
             return []
+        # every device in netbox is matched, prepare the globs only once
+        globs = [subquery.strip() for subquery in query.globs]
         return [
             device
             for device in self.netbox.dcim_all_devices().results
-            if _match_query(query, device)
+            if _match_query(globs, device)
         ]
 
     def _load_interfaces(self, device_ids: List[int]) -> List[
@@ -172,6 +176,8 @@ class NetboxStorageV24(Storage):
             interface.id: extend_interface(interface)
             for interface in interfaces.results
         }
+        if not extended_ifaces:
+            return []
 
         ips = self.netbox.ipam_all_ip_addresses(interface_id=list(extended_ifaces))
         for ip in ips.results:
@@ -193,8 +199,8 @@ class NetboxStorageV24(Storage):
         pass
 
 
-def _match_query(query: NetboxQuery, device_data: api_models.Device) -> bool:
-    for subquery in query.globs:
-        if subquery.strip() in device_data.name:
+def _match_query(globs: List[str], device_data: api_models.Device) -> bool:
+    for subquery in globs:
+        if subquery in device_data.name:
             return True
     return False
@@ -1,3 +1,4 @@
+import sys
 from logging import getLogger
 from typing import Any, Optional, List, Union, Dict
 from ipaddress import ip_interface
@@ -65,6 +66,9 @@ def extend_device(
         storage=storage,
     )
     res.neighbours = neighbours
+    # a device is loaded again as a neighbour of every adjacent device,
+    # share a single fqdn string between all of its copies
+    res.fqdn = res.hostname = sys.intern(res.fqdn)
     return res
 
 
@@ -133,12 +137,13 @@ class NetboxStorageV37(Storage):
         neighbours_seen = defaultdict(set)
 
         for interface in interfaces:
-            device_ids[interface.device.id].interfaces.append(interface)
+            device = device_ids[interface.device.id]
+            device.interfaces.append(interface)
+            seen = neighbours_seen[device.id]
             for e in interface.connected_endpoints or []:
-                neighbour = neighbours[e.device.id]
-                if neighbour.id not in neighbours_seen[interface.device.id]:
-                    neighbours_seen[interface.device.id].add(neighbour.id)
-                    device_ids[interface.device.id].neighbours.append(neighbour)
+                if e.device.id not in seen:
+                    seen.add(e.device.id)
+                    device.neighbours.append(neighbours[e.device.id])
 
         return list(device_ids.values())
 
@@ -146,23 +151,29 @@ class NetboxStorageV37(Storage):
         if not query.globs:
             return []
         query = _hostname_dot_hack(query)
+        globs = [subquery.strip() for subquery in query.globs]
         return [
             device
             for device in self.netbox.dcim_all_devices(
                 name__ic=query.globs,
             ).results
-            if _match_query(query, device)
+            if _match_query(globs, device)
         ]
 
     def _extend_interfaces(self, interfaces: List[models.Interface]) -> List[models.Interface]:
+        if not interfaces:
+            return []
         extended_ifaces = {
             interface.id: extend_interface(interface, [])
             for interface in interfaces
         }
 
         ips = self.netbox.ipam_all_ip_addresses(interface_id=list(extended_ifaces))
+        if not ips.results:
+            return list(extended_ifaces.values())
         ip_to_cidrs: Dict[str, str] = {ip.address: str(ip_interface(ip.address).network) for ip in ips.results}
-        prefixes = self.netbox.ipam_all_prefixes(prefix=list(ip_to_cidrs.values()))
+        # addresses of one network share a prefix, request it once
+        prefixes = self.netbox.ipam_all_prefixes(prefix=list(dict.fromkeys(ip_to_cidrs.values())))
         cidr_to_prefix: Dict[str, models.Prefix] = {x.prefix: x for x in prefixes.results}
 
         for ip in ips.results:
@@ -182,8 +193,12 @@ class NetboxStorageV37(Storage):
 
     def _load_neighbours(self, interfaces: List[models.Interface]) -> List[models.NetboxDevice]:
         endpoints = [e for i in interfaces for e in i.connected_endpoints or []]
+        if not endpoints:
+            return []
         remote_interfaces_ids = [e.id for e in endpoints]
-        neighbours_ids = [e.device.id for e in endpoints]
+        # several links usually lead to the same neighbour,
+        # so request each neighbour device only once per batch
+        neighbours_ids = list(dict.fromkeys(e.device.id for e in endpoints))
         neighbours_ifaces_dics = defaultdict(list)
         # load only the connected interface to speed things up
         for iface in self._load_interfaces_by_id(remote_interfaces_ids):
@@ -219,9 +234,9 @@ class NetboxStorageV37(Storage):
         pass
 
 
-def _match_query(query: NetboxQuery, device_data: api_models.Device) -> bool:
-    for subquery in query.globs:
-        if subquery.strip() in device_data.name:
+def _match_query(globs: List[str], device_data: api_models.Device) -> bool:
+    for subquery in globs:
+        if subquery in device_data.name:
             return True
     return False
 